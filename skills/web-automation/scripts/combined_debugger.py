@@ -26,6 +26,7 @@ import json
 import re
 import sys
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Any
 
 from playwright.async_api import async_playwright
@@ -236,7 +237,7 @@ class CombinedDebugger:
     def _build_output(self) -> dict[str, Any]:
         """Build final output with correlation."""
         # Sort events by timestamp
-        sorted_events = sorted(self.events, key=lambda e: e["timestamp_ms"])
+        sorted_events = sorted(self.events, key=itemgetter("timestamp_ms"))
 
         # Correlate errors with surrounding events
         correlated_events = []
@@ -1,6 +1,6 @@
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["playwright"]
+# dependencies = ["orjson", "playwright"]
 # ///
 # ABOUTME: Console log and JavaScript error capture using Chrome DevTools Protocol
 # ABOUTME: Captures console.log/warn/error, exceptions, and unhandled promise rejections
@@ -22,48 +22,208 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import sys
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable
 
+import orjson
 from playwright.async_api import async_playwright
 
+# With stop_when_idle, capture ends once no console event or exception has
+# arrived for this many seconds after the page loaded
+IDLE_QUIET_PERIOD = 2.0
+
+# Console type -> severity level; built once instead of per event
+_LEVEL_MAP = MappingProxyType(
+    {
+        "log": "info",
+        "info": "info",
+        "debug": "debug",
+        "warning": "warning",
+        "warn": "warning",
+        "error": "error",
+        "assert": "error",
+        "trace": "debug",
+        "dir": "info",
+        "dirxml": "info",
+        "table": "info",
+        "count": "info",
+        "timeEnd": "info",
+        "group": "info",
+        "groupCollapsed": "info",
+        "groupEnd": "info",
+        "clear": "info",
+    }
+)
+_DEFAULT_LEVEL = "info"
+
+# Console types kept when errors_only is set
+_ERROR_TYPES = frozenset(("error", "warning", "assert"))
+
+
+def _now_timestamp() -> float:
+    """Current UTC time as a POSIX timestamp."""
+    return datetime.now(timezone.utc).timestamp()
+
+
+def _format_undefined(obj: dict) -> Any:
+    """Format an undefined RemoteObject."""
+    return "undefined"
+
+
+def _format_primitive(obj: dict) -> Any:
+    """Format a string, number, or boolean RemoteObject."""
+    return obj.get("value")
+
+
+def _format_object(obj: dict) -> Any:
+    """Format an object RemoteObject (null, error, or plain object)."""
+    subtype = obj.get("subtype")
+    if subtype == "null":
+        return None
+    if subtype == "error":
+        return obj.get("description", str(obj.get("value")))
+    if "value" in obj:
+        return obj["value"]
+    return obj.get("description", f"[{obj.get('className', 'Object')}]")
+
+
+def _format_other(obj: dict) -> Any:
+    """Format any other RemoteObject type from its description."""
+    return obj.get("description", str(obj.get("value")))
+
+
+# RemoteObject type -> formatter; one dict lookup instead of an if/elif chain per arg
+_FORMATTERS: MappingProxyType[str, Callable[[dict], Any]] = MappingProxyType(
+    {
+        "undefined": _format_undefined,
+        "string": _format_primitive,
+        "number": _format_primitive,
+        "boolean": _format_primitive,
+        "object": _format_object,
+    }
+)
+
+
+def _format_remote_object(obj: dict) -> Any:
+    """Format a CDP RemoteObject for output."""
+    return _FORMATTERS.get(obj.get("type", "undefined"), _format_other)(obj)
+
+
+@dataclass(slots=True)
+class ConsoleEntry:
+    """A captured console API call; with dedupe, repeats of the same message bump count."""
+
+    type: str
+    level: str
+    text: str
+    args: tuple[Any, ...]
+    count: int | None = None
+    timestamp: float | None = None
+    stack: list[dict] | None = None
+
+
+@dataclass(slots=True)
+class ExceptionEntry:
+    """A captured exception or navigation failure."""
+
+    type: str
+    level: str
+    text: str
+    description: str
+    exception_id: int | None = None
+    line: int | None = None
+    column: int | None = None
+    url: str | None = None
+    timestamp: float | None = None
+    stack: list[dict] | None = None
+
+
+# Output key order per entry kind; fields left as None are omitted
+_ENTRY_KEYS: MappingProxyType[type, tuple[str, ...]] = MappingProxyType(
+    {
+        ConsoleEntry: ("type", "level", "text", "args", "count", "timestamp", "stack"),
+        ExceptionEntry: (
+            "type",
+            "level",
+            "exception_id",
+            "text",
+            "description",
+            "line",
+            "column",
+            "url",
+            "timestamp",
+            "stack",
+        ),
+    }
+)
+
+
+def _entry_to_dict(entry: ConsoleEntry | ExceptionEntry) -> dict[str, Any]:
+    """Materialize an entry as an output dict, only at serialization time."""
+    result = {}
+    for key in _ENTRY_KEYS[type(entry)]:
+        value = getattr(entry, key)
+        if value is not None:
+            result[key] = value
+    return result
+
 
 class ConsoleDebugger:
     """Captures console messages and exceptions via CDP Runtime domain."""
 
+    __slots__ = (
+        "errors_only",
+        "with_stack_traces",
+        "include_timestamps",
+        "dedupe_messages",
+        "stop_when_idle",
+        "_last_event",
+        "_queue",
+        "dropped",
+        "entries",
+        "message_count",
+        "exception_count",
+        "_seen",
+        "duplicate_count",
+    )
+
     def __init__(
         self,
         errors_only: bool = False,
         with_stack_traces: bool = True,
         include_timestamps: bool = True,
+        max_queue_size: int = 100_000,
+        dedupe_messages: bool = True,
+        stop_when_idle: bool = False,
     ):
         self.errors_only = errors_only
         self.with_stack_traces = with_stack_traces
         self.include_timestamps = include_timestamps
+        self.dedupe_messages = dedupe_messages
+        self.stop_when_idle = stop_when_idle
+
+        # time.monotonic() of the latest CDP console/exception event
+        self._last_event = 0.0
+
+        # CDP callbacks only enqueue raw params; _drain() formats them off the hot path.
+        # When full, the oldest pending event is dropped so memory stays bounded.
+        self._queue: asyncio.Queue[tuple[Callable[[dict], None], dict]] = asyncio.Queue(
+            maxsize=max_queue_size
+        )
+        self.dropped = 0
 
-        self.messages: list[dict[str, Any]] = []
-        self.exceptions: list[dict[str, Any]] = []
-
-    def _format_remote_object(self, obj: dict) -> Any:
-        """Format a CDP RemoteObject for output."""
-        obj_type = obj.get("type", "undefined")
-
-        if obj_type == "undefined":
-            return "undefined"
-        elif obj_type == "object":
-            if obj.get("subtype") == "null":
-                return None
-            if obj.get("subtype") == "error":
-                return obj.get("description", str(obj.get("value")))
-            if "value" in obj:
-                return obj["value"]
-            return obj.get("description", f"[{obj.get('className', 'Object')}]")
-        elif obj_type in ("string", "number", "boolean"):
-            return obj.get("value")
-        else:
-            return obj.get("description", str(obj.get("value")))
+        # Single list in arrival order; CDP delivers events already time-ordered
+        self.entries: list[ConsoleEntry | ExceptionEntry] = []
+        self.message_count = 0
+        self.exception_count = 0
+
+        # (type, text, call sites) -> first stored message; repeats only bump its count
+        self._seen: dict[tuple[str, str, tuple], ConsoleEntry] = {}
+        self.duplicate_count = 0
 
     def _format_stack_trace(self, stack_trace: dict) -> list[dict]:
         """Format a CDP StackTrace for output."""
@@ -79,79 +239,152 @@ class ConsoleDebugger:
             )
         return frames
 
+    def _enqueue(self, handler: Callable[[dict], None], params: dict) -> None:
+        """Queue a raw CDP event for the drain task, dropping the oldest when full."""
+        try:
+            self._queue.put_nowait((handler, params))
+        except asyncio.QueueFull:
+            self._queue.get_nowait()
+            self.dropped += 1
+            self._queue.put_nowait((handler, params))
+
+    def _flush_queue(self) -> None:
+        """Record every event still waiting in the queue."""
+        while True:
+            try:
+                handler, params = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            handler(params)
+
+    async def _drain(self) -> None:
+        """Consume queued CDP events and record them."""
+        while True:
+            handler, params = await self._queue.get()
+            handler(params)
+
+    async def _navigate(self, page: Any, url: str, wait_for_idle: bool) -> None:
+        """Load the page and optionally wait for network idle."""
+        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+
+        if wait_for_idle:
+            try:
+                await page.wait_for_load_state("networkidle", timeout=10000)
+            except Exception:
+                pass
+
+    async def _run_until_settled(
+        self, page: Any, url: str, wait_for_idle: bool, duration: float
+    ) -> None:
+        """
+        Navigate and listen within a hard budget of duration seconds.
+
+        Returns early once the page has loaded (and gone idle, if requested)
+        and no console event has arrived for IDLE_QUIET_PERIOD seconds.
+        Raises TimeoutError if the page does not load within the budget.
+        """
+        deadline = time.monotonic() + duration
+        try:
+            async with asyncio.timeout(duration):
+                await self._navigate(page, url, wait_for_idle)
+        except TimeoutError:
+            raise TimeoutError(f"page did not load within {duration}s") from None
+
+        # The quiet period starts no earlier than the end of the load
+        self._last_event = max(self._last_event, time.monotonic())
+        while True:
+            now = time.monotonic()
+            quiet_until = self._last_event + IDLE_QUIET_PERIOD
+            if now >= deadline or now >= quiet_until:
+                return
+            await asyncio.sleep(min(quiet_until, deadline) - now)
+
     def _on_console_api_called(self, params: dict) -> None:
         """Handle Runtime.consoleAPICalled event."""
+        self._last_event = time.monotonic()
         msg_type = params.get("type", "log")
 
-        if self.errors_only and msg_type not in ("error", "warning", "assert"):
+        # Filter before queueing so dropped events are never formatted
+        if self.errors_only and msg_type not in _ERROR_TYPES:
             return
 
-        args = params.get("args", [])
-        formatted_args = [self._format_remote_object(arg) for arg in args]
+        self._enqueue(self._record_console_api_called, params)
 
-        message = {
-            "type": msg_type,
-            "level": self._type_to_level(msg_type),
-            "text": " ".join(str(arg) for arg in formatted_args),
-            "args": formatted_args,
-        }
+    def _on_exception_thrown(self, params: dict) -> None:
+        """Handle Runtime.exceptionThrown event."""
+        self._last_event = time.monotonic()
+        self._enqueue(self._record_exception_thrown, params)
+
+    def _record_console_api_called(self, params: dict) -> None:
+        """Format and store a Runtime.consoleAPICalled event."""
+        msg_type = params.get("type", "log")
+        args = params.get("args", [])
+        formatted_args = tuple(map(_format_remote_object, args))
+        text = " ".join(map(str, formatted_args))
+
+        self.message_count += 1
+        if self.dedupe_messages:
+            # With stack traces, the same text from another call site is a
+            # separate entry so its stack is not lost
+            sites = ()
+            if self.with_stack_traces and "stackTrace" in params:
+                sites = tuple(
+                    (f.get("url"), f.get("lineNumber"), f.get("columnNumber"))
+                    for f in params["stackTrace"].get("callFrames", ())
+                )
+            key = (msg_type, text, sites)
+            seen = self._seen.get(key)
+            if seen is not None:
+                seen.count += 1
+                self.duplicate_count += 1
+                return
+
+        message = ConsoleEntry(
+            type=msg_type,
+            level=_LEVEL_MAP.get(msg_type, _DEFAULT_LEVEL),
+            text=text,
+            args=formatted_args,
+            count=1 if self.dedupe_messages else None,
+        )
 
         if self.include_timestamps:
-            message["timestamp"] = params.get("timestamp", datetime.now(timezone.utc).timestamp())
+            timestamp = params.get("timestamp")
+            message.timestamp = timestamp if timestamp is not None else _now_timestamp()
 
         if self.with_stack_traces and "stackTrace" in params:
-            message["stack"] = self._format_stack_trace(params["stackTrace"])
+            message.stack = self._format_stack_trace(params["stackTrace"])
 
-        self.messages.append(message)
+        if self.dedupe_messages:
+            self._seen[key] = message
+        self.entries.append(message)
 
-    def _on_exception_thrown(self, params: dict) -> None:
-        """Handle Runtime.exceptionThrown event."""
+    def _record_exception_thrown(self, params: dict) -> None:
+        """Format and store a Runtime.exceptionThrown event."""
         exception_details = params.get("exceptionDetails", {})
         exception_obj = exception_details.get("exception", {})
 
-        exception = {
-            "type": "exception",
-            "level": "error",
-            "exception_id": exception_details.get("exceptionId"),
-            "text": exception_details.get("text", ""),
-            "description": exception_obj.get("description", ""),
-            "line": exception_details.get("lineNumber", 0) + 1,
-            "column": exception_details.get("columnNumber", 0) + 1,
-            "url": exception_details.get("url", ""),
-        }
+        exception = ExceptionEntry(
+            type="exception",
+            level="error",
+            exception_id=exception_details.get("exceptionId"),
+            text=exception_details.get("text", ""),
+            description=exception_obj.get("description", ""),
+            line=exception_details.get("lineNumber", 0) + 1,
+            column=exception_details.get("columnNumber", 0) + 1,
+            url=exception_details.get("url", ""),
+        )
 
         if self.include_timestamps:
-            exception["timestamp"] = params.get("timestamp", datetime.now(timezone.utc).timestamp())
+            timestamp = params.get("timestamp")
+            exception.timestamp = timestamp if timestamp is not None else _now_timestamp()
 
         if self.with_stack_traces:
             stack_trace = exception_details.get("stackTrace")
             if stack_trace:
-                exception["stack"] = self._format_stack_trace(stack_trace)
-
-        self.exceptions.append(exception)
-
-    def _type_to_level(self, msg_type: str) -> str:
-        """Map console type to severity level."""
-        mapping = {
-            "log": "info",
-            "info": "info",
-            "debug": "debug",
-            "warning": "warning",
-            "warn": "warning",
-            "error": "error",
-            "assert": "error",
-            "trace": "debug",
-            "dir": "info",
-            "dirxml": "info",
-            "table": "info",
-            "count": "info",
-            "timeEnd": "info",
-            "group": "info",
-            "groupCollapsed": "info",
-            "groupEnd": "info",
-            "clear": "info",
-        }
-        return mapping.get(msg_type, "info")
+                exception.stack = self._format_stack_trace(stack_trace)
+
+        self.entries.append(exception)
+        self.exception_count += 1
 
     async def capture(
         self,
@@ -162,6 +395,11 @@ class ConsoleDebugger:
         """
         Capture console messages and exceptions for a URL.
 
+        By default the full duration is captured after the page loads. With
+        stop_when_idle, navigation and capture share the duration budget and
+        capture ends once the page has loaded and gone IDLE_QUIET_PERIOD
+        seconds without a console event or exception.
+
         Args:
             url: URL to navigate to
             duration: Maximum capture duration in seconds
@@ -177,69 +415,89 @@ class ConsoleDebugger:
 
             client = await context.new_cdp_session(page)
 
-            await client.send("Runtime.enable")
-            await client.send("Log.enable")
-
             client.on("Runtime.consoleAPICalled", self._on_console_api_called)
             client.on("Runtime.exceptionThrown", self._on_exception_thrown)
 
-            try:
-                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            # Independent setup commands: keep the round-trips in flight together
+            setup = [client.send("Runtime.enable")]
+            if self.errors_only:
+                # Only Runtime events are consumed here: skip the Log domain and
+                # async parent stacks to cut per-event CDP payload
+                setup.append(client.send("Runtime.setAsyncCallStackDepth", {"maxDepth": 0}))
+            else:
+                setup.append(client.send("Log.enable"))
+            await asyncio.gather(*setup)
 
-                if wait_for_idle:
-                    try:
-                        await page.wait_for_load_state("networkidle", timeout=10000)
-                    except Exception:
-                        pass
+            drain_task = asyncio.create_task(self._drain())
+            navigation_error: ExceptionEntry | None = None
+            started = asyncio.get_running_loop().time()
 
-                await asyncio.sleep(duration)
+            try:
+                if self.stop_when_idle:
+                    await self._run_until_settled(page, url, wait_for_idle, duration)
+                else:
+                    await self._navigate(page, url, wait_for_idle)
+                    await asyncio.sleep(duration)
 
             except Exception as e:
-                self.exceptions.append(
-                    {
-                        "type": "navigation_error",
-                        "level": "error",
-                        "text": f"Navigation failed: {e}",
-                        "description": str(e),
-                    }
+                navigation_error = ExceptionEntry(
+                    type="navigation_error",
+                    level="error",
+                    text=f"Navigation failed: {e}",
+                    description=str(e),
                 )
 
             finally:
+                elapsed = asyncio.get_running_loop().time() - started
                 await browser.close()
+                drain_task.cancel()
+                try:
+                    await drain_task
+                except asyncio.CancelledError:
+                    pass
+                self._flush_queue()
+
+            if navigation_error:
+                self.entries.append(navigation_error)
+                self.exception_count += 1
 
-        all_entries = self.messages + self.exceptions
-        all_entries.sort(key=lambda x: x.get("timestamp", 0))
+        all_entries = self.entries
 
-        error_count = sum(1 for e in all_entries if e.get("level") == "error")
-        warning_count = sum(1 for e in all_entries if e.get("level") == "warning")
+        error_count = sum(1 for e in all_entries if e.level == "error")
+        warning_count = sum(1 for e in all_entries if e.level == "warning")
 
         return {
             "metadata": {
                 "url": url,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "duration_seconds": duration,
+                "elapsed_seconds": round(elapsed, 3),
                 "browser": "Chromium",
                 "options": {
                     "errors_only": self.errors_only,
                     "with_stack_traces": self.with_stack_traces,
+                    "dedupe_messages": self.dedupe_messages,
+                    "stop_when_idle": self.stop_when_idle,
                 },
             },
-            "data": all_entries,
+            "data": [_entry_to_dict(e) for e in all_entries],
             "summary": {
                 "total": len(all_entries),
-                "messages": len(self.messages),
-                "exceptions": len(self.exceptions),
+                "messages": self.message_count,
+                "exceptions": self.exception_count,
+                "duplicates": self.duplicate_count,
+                "dropped": self.dropped,
                 "by_level": self._count_by_level(all_entries),
                 "errors": error_count,
                 "warnings": warning_count,
             },
         }
 
-    def _count_by_level(self, entries: list[dict]) -> dict[str, int]:
+    def _count_by_level(self, entries: list[ConsoleEntry | ExceptionEntry]) -> dict[str, int]:
         """Count entries by severity level."""
         counts: dict[str, int] = {}
         for entry in entries:
-            level = entry.get("level", "info")
+            level = entry.level
             counts[level] = counts.get(level, 0) + 1
         return counts
 
@@ -287,6 +545,16 @@ Captured message types:
         action="store_true",
         help="Exclude stack traces from output",
     )
+    parser.add_argument(
+        "--no-dedupe",
+        action="store_true",
+        help="Keep every repeated console message instead of counting duplicates",
+    )
+    parser.add_argument(
+        "--stop-when-idle",
+        action="store_true",
+        help=f"Stop before --duration once the console has been quiet for {IDLE_QUIET_PERIOD:g}s after load",
+    )
     parser.add_argument(
         "--output",
         "-o",
@@ -300,17 +568,25 @@ Captured message types:
     debugger = ConsoleDebugger(
         errors_only=args.errors_only,
         with_stack_traces=with_stack_traces,
+        dedupe_messages=not args.no_dedupe,
+        stop_when_idle=args.stop_when_idle,
     )
 
     results = await debugger.capture(args.url, duration=args.duration)
 
-    json_str = json.dumps(results, indent=2, default=str)
+    # orjson encodes straight to bytes, so no intermediate str or re-encode
+    raw = orjson.dumps(
+        results,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+    )
     if args.output:
-        with open(args.output, "w") as f:
-            f.write(json_str)
+        with open(args.output, "wb") as f:
+            f.write(raw)
         print(f"Output written to: {args.output}", file=sys.stderr)
     else:
-        print(json_str)
+        sys.stdout.buffer.write(raw)
+        sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
@@ -14,9 +14,28 @@ Usage:
     page.goto('https://example.com')
     page.wait_for_load_state('networkidle')
     dismiss_cookie_consent(page)  # ALWAYS call after navigation
+
+From async code, use the *_async variants so the event loop is never blocked:
+    from cookie_consent import dismiss_cookie_consent_async
+
+    await page.goto('https://example.com')
+    await dismiss_cookie_consent_async(page)
+
+Or register once and let Playwright click banners as they appear:
+    from cookie_consent import install_cookie_consent_handler
+
+    install_cookie_consent_handler(page)  # Before the first action
+    page.goto('https://example.com')
 """
 
-from playwright.sync_api import Page
+import asyncio
+import json
+import re
+import weakref
+from typing import Any
+
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import Locator, Page
 
 
 # Comprehensive list of cookie consent selectors, ordered by specificity
@@ -95,6 +114,340 @@ COOKIE_SELECTORS = [
     '[class*="gdpr"] button:first-of-type',
 ]
 
+# Class/id substrings that mark overlay, modal, and consent containers (force_remove_overlay)
+OVERLAY_CLASS_PATTERNS = [
+    'cookie', 'consent', 'gdpr', 'privacy', 'notice', 'banner',
+    'modal', 'overlay', 'popup', 'dialog', 'backdrop', 'mask',
+    'notification', 'alert-overlay', 'blocker',
+]
+OVERLAY_ID_PATTERNS = [
+    'cookie', 'consent', 'gdpr', 'privacy', 'modal', 'overlay', 'popup',
+]
+
+# Playwright-only `button:has-text("...")` selectors, matched by text in the browser
+_HAS_TEXT_RE = re.compile(r'^button:has-text\("(.+)"\)$')
+
+# Elements whose id, class or label marks them as a cookie/consent banner
+_CONSENT_CONTAINER = (
+    ':is([id*="cookie" i], [class*="cookie" i], [id*="consent" i], '
+    '[class*="consent" i], [aria-label*="cookie" i], [aria-label*="consent" i])'
+)
+
+# Subset of COOKIE_SELECTORS safe to click unattended from a locator handler:
+# text matches are scoped to consent containers (a bare "OK" or "Continue"
+# would hit the page's own buttons), and the any-dialog and any-button
+# fallbacks (which may pick "Reject" or "Settings") are left out
+HANDLER_COOKIE_SELECTORS = [
+    *(
+        sel for sel in COOKIE_SELECTORS
+        if not _HAS_TEXT_RE.match(sel)
+        and not sel.startswith('[role="dialog"]')
+        and not sel.endswith((" button", ":first-of-type"))
+    ),
+    *(f"{_CONSENT_CONTAINER} {sel}" for sel in COOKIE_SELECTORS if _HAS_TEXT_RE.match(sel)),
+]
+
+
+def _cookie_probe(selector: str) -> tuple[str, str]:
+    """Split a COOKIE_SELECTORS entry into a (kind, value) probe for in-page matching."""
+    match = _HAS_TEXT_RE.match(selector)
+    if match:
+        return ("text", match.group(1))
+    return ("css", selector)
+
+
+# Browser-side helpers, installed once per page as window.__cc so each call
+# only ships a tiny evaluate() instead of re-parsing the full script
+COOKIE_JS_BUNDLE = '''(() => {
+    const cookieProbes = __COOKIE_PROBES__;
+
+    // Overlay class/id matchers, compiled once per page when the bundle installs
+    const overlayClassRe = new RegExp(__OVERLAY_CLASS_RE__);
+    const overlayIdRe = new RegExp(__OVERLAY_ID_RE__);
+
+    // Playwright-style visibility: has a layout box and is not visibility:hidden
+    const isVisible = (el) =>
+        el.getClientRects().length > 0 && window.getComputedStyle(el).visibility !== 'hidden';
+
+    // The document plus every open shadow root below it, which Playwright
+    // locators pierce but document.querySelectorAll does not
+    const searchRoots = () => {
+        const roots = [document];
+        for (let i = 0; i < roots.length; i++) {
+            for (const el of roots[i].querySelectorAll('*')) {
+                if (el.shadowRoot) roots.push(el.shadowRoot);
+            }
+        }
+        return roots;
+    };
+
+    const findCookieButton = () => {
+        const roots = searchRoots();
+        const queryAll = (selector) => roots.flatMap((root) => [...root.querySelectorAll(selector)]);
+        let buttons = null;
+        for (const [kind, value] of cookieProbes) {
+            if (kind === 'css') {
+                let matches;
+                try {
+                    matches = queryAll(value);
+                } catch (e) {
+                    continue;
+                }
+                for (const el of matches) {
+                    if (isVisible(el)) return { el, selector: value };
+                }
+            } else {
+                // Same semantics as Playwright's :has-text(): case-insensitive substring
+                const needle = value.toLowerCase();
+                buttons = buttons || queryAll('button');
+                for (const el of buttons) {
+                    if ((el.textContent || '').toLowerCase().includes(needle) && isVisible(el)) {
+                        return { el, selector: `button:has-text("${value}")` };
+                    }
+                }
+            }
+        }
+        return null;
+    };
+
+    // Resolve after quietMs without DOM mutations, or after maxMs at the latest
+    const settle = (quietMs, maxMs) => new Promise((resolve) => {
+        let quiet;
+        let cap;
+        const observer = new MutationObserver(() => {
+            clearTimeout(quiet);
+            quiet = setTimeout(done, quietMs);
+        });
+        function done() {
+            observer.disconnect();
+            clearTimeout(quiet);
+            clearTimeout(cap);
+            resolve();
+        }
+        quiet = setTimeout(done, quietMs);
+        cap = setTimeout(done, maxMs);
+        observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true });
+    });
+
+    // Accept-related button texts, compiled once into a single alternation
+    const acceptRe = /\\b(accept all|accept cookies|allow all|allow cookies|i agree|agree|got it|ok|continue|accetta|accetto|consenti|akzeptieren|zustimmen|accepter|j'accepte|aceptar)\\b/i;
+
+    window.__cc = window.__cc || {
+        dismiss() {
+            const buttons = document.querySelectorAll('button, [role="button"], a.button');
+            for (const btn of buttons) {
+                if (acceptRe.test(btn.textContent || '')) {
+                    btn.click();
+                    return { found: true, text: btn.textContent };
+                }
+            }
+            return { found: false };
+        },
+
+        async dismissAll() {
+            // Cookie consent: first visible match in COOKIE_SELECTORS order
+            const cookie = findCookieButton();
+            if (cookie) {
+                cookie.el.click();
+                // Let the banner close before looking for other dialogs
+                await settle(200, 500);
+            }
+
+            // Close any modal/dialog overlays by clicking close buttons
+            const closeSelectors = [
+                '[aria-label="Close"]',
+                '[aria-label="close"]',
+                'button[class*="close"]',
+                'button[class*="dismiss"]',
+                '.modal-close',
+                '.popup-close',
+                '.overlay-close',
+                '[data-dismiss="modal"]',
+                '.btn-close',
+                'button svg[class*="close"]',
+                '[data-testid="close-button"]',
+                '[data-testid="modal-close"]',
+            ];
+
+            let closed = false;
+            for (const sel of closeSelectors) {
+                const btn = document.querySelector(sel);
+                if (btn && btn.offsetParent !== null) {
+                    btn.click();
+                    closed = true;
+                    break;
+                }
+            }
+
+            // Remove overlay elements that block interaction
+            const overlaySelectors = [
+                '.modal-backdrop',
+                '.overlay',
+                '[class*="overlay"]',
+                '[class*="modal-overlay"]',
+                '[class*="popup-overlay"]',
+                '[class*="backdrop"]',
+            ];
+
+            let removed = 0;
+            for (const el of document.querySelectorAll(overlaySelectors.join(','))) {
+                const style = window.getComputedStyle(el);
+                if (style.position === 'fixed' || style.position === 'absolute') {
+                    el.remove();
+                    removed++;
+                }
+            }
+
+            // Return once the DOM has settled instead of sleeping a fixed time
+            if (cookie || closed || removed) await settle(200, 1000);
+
+            return { cookie: cookie ? cookie.selector : null, closed, removed };
+        },
+
+        force() {
+            let removed = 0;
+            const removedElements = [];
+
+            const vw = window.innerWidth;
+            const vh = window.innerHeight;
+
+            // 1. Single DOM pass: match class/id patterns, then high z-index full-screen layers
+            for (const el of document.querySelectorAll('*')) {
+                // Skip descendants of an element removed earlier in this pass
+                if (!el.isConnected) continue;
+
+                const style = window.getComputedStyle(el);
+                const position = style.position;
+                if (position !== 'fixed' && position !== 'absolute') continue;
+
+                let rect = null;
+                let zIndex;
+                let match = false;
+
+                if (overlayClassRe.test(el.getAttribute('class') || '')) {
+                    rect = el.getBoundingClientRect();
+                    // Check if element covers significant viewport area or is near top/bottom
+                    const coversViewport = rect.width > vw * 0.3 || rect.height > vh * 0.2;
+                    const isEdgeBanner = rect.top <= 100 || rect.bottom >= vh - 100;
+                    match = coversViewport || isEdgeBanner;
+                }
+
+                if (!match && overlayIdRe.test(el.id || '')) {
+                    match = true;
+                }
+
+                if (!match && position === 'fixed') {
+                    const z = parseInt(style.zIndex) || 0;
+                    if (z > 100) {
+                        rect = rect || el.getBoundingClientRect();
+                        // High z-index AND covers most of viewport
+                        if (rect.width > vw * 0.5 && rect.height > vh * 0.5) {
+                            match = true;
+                            zIndex = z;
+                        }
+                    }
+                }
+
+                if (match) {
+                    const entry = {
+                        tag: el.tagName,
+                        class: el.className,
+                        id: el.id
+                    };
+                    if (zIndex !== undefined) entry.zIndex = zIndex;
+                    removedElements.push(entry);
+                    el.remove();
+                    removed++;
+                }
+            }
+
+            // 2. Reset body overflow (often set to 'hidden' when modals are open)
+            document.body.style.overflow = 'auto';
+            document.documentElement.style.overflow = 'auto';
+
+            return { removed, elements: removedElements };
+        },
+
+        setStorage() {
+            // Common localStorage keys
+            const consentKeys = [
+                'cookie-consent', 'cookieConsent', 'cookies-accepted',
+                'gdpr-consent', 'gdprConsent', 'privacy-consent',
+                'CookieConsent', 'cookie_consent', 'cookies_accepted'
+            ];
+
+            for (const key of consentKeys) {
+                localStorage.setItem(key, 'accepted');
+                localStorage.setItem(key, 'true');
+                localStorage.setItem(key, '1');
+            }
+
+            // Set cookies too
+            document.cookie = 'cookie-consent=accepted; path=/; max-age=31536000';
+            document.cookie = 'gdpr-consent=accepted; path=/; max-age=31536000';
+        },
+    };
+})();
+'''
+COOKIE_JS_BUNDLE = (
+    COOKIE_JS_BUNDLE
+    .replace("__COOKIE_PROBES__", json.dumps([_cookie_probe(sel) for sel in COOKIE_SELECTORS]))
+    .replace("__OVERLAY_CLASS_RE__", json.dumps("|".join(map(re.escape, OVERLAY_CLASS_PATTERNS))))
+    .replace("__OVERLAY_ID_RE__", json.dumps("|".join(map(re.escape, OVERLAY_ID_PATTERNS))))
+)
+
+_bundled_pages: "weakref.WeakSet[Page | AsyncPage]" = weakref.WeakSet()
+
+# Invokes window.__cc[name]() and reports whether the bundle was present
+_CC_CALL = "async (name) => window.__cc ? { ok: true, value: await window.__cc[name]() } : { ok: false }"
+
+
+def _call_cookie_js(page: Page, name: str) -> Any:
+    """
+    Call a window.__cc helper, installing the bundle on first use.
+
+    The bundle is registered as an init script so it survives navigations,
+    and evaluated directly when the current document does not have it yet.
+    """
+    if page not in _bundled_pages:
+        page.add_init_script(script=COOKIE_JS_BUNDLE)
+        _bundled_pages.add(page)
+
+    result = page.evaluate(_CC_CALL, name)
+    if not result["ok"]:
+        page.evaluate(COOKIE_JS_BUNDLE)
+        result = page.evaluate(_CC_CALL, name)
+    return result.get("value")
+
+
+async def _call_cookie_js_async(page: AsyncPage, name: str) -> Any:
+    """Async counterpart of _call_cookie_js()."""
+    if page not in _bundled_pages:
+        await page.add_init_script(script=COOKIE_JS_BUNDLE)
+        _bundled_pages.add(page)
+
+    result = await page.evaluate(_CC_CALL, name)
+    if not result["ok"]:
+        await page.evaluate(COOKIE_JS_BUNDLE)
+        result = await page.evaluate(_CC_CALL, name)
+    return result.get("value")
+
+
+def _report_overlays(result: dict) -> None:
+    """Print the outcome of a dismissAll() call."""
+    if result.get('cookie'):
+        print(f"[COOKIE] Found and clicking: {result['cookie']}")
+    else:
+        print("[COOKIE] No cookie consent banner found")
+    print("[OVERLAY] Dismissed all overlays")
+
+
+def _report_force_removed(result: dict) -> None:
+    """Print the elements removed by a force() call."""
+    print(f"[FORCE-REMOVE] Removed {result['removed']} blocking elements:")
+    for el in result.get('elements', []):
+        print(f"  - <{el['tag']}> class='{el.get('class', '')}' id='{el.get('id', '')}'")
+
 
 def dismiss_cookie_consent(page: Page, timeout: int = 3000, verbose: bool = False) -> bool:
     """
@@ -130,6 +483,44 @@ def dismiss_cookie_consent(page: Page, timeout: int = 3000, verbose: bool = Fals
     return False
 
 
+def install_cookie_consent_handler(
+    page: Page, verbose: bool = False, times: int | None = None
+) -> None:
+    """
+    Auto-dismiss cookie banners with Playwright's locator handler (Playwright 1.44+).
+
+    Playwright checks for the banner itself before each actionable step
+    (click, fill, ...) and runs the handler only when a consent button is
+    visible, so there is no per-page polling. It does not fire on goto()
+    alone; call dismiss_cookie_consent() if you only take screenshots.
+
+    Only HANDLER_COOKIE_SELECTORS are watched, so generic buttons outside a
+    cookie/consent container are never clicked.
+
+    Args:
+        page: Playwright Page object
+        verbose: Print debug info
+        times: Remove the handler after it has run this many times
+            (default: keep it for the page's lifetime)
+
+    Usage:
+        install_cookie_consent_handler(page)  # Once, before the first action
+        page.goto('https://example.com')
+        page.click('text=Login')  # Banner is dismissed first if present
+    """
+    def handler(locator: Locator) -> None:
+        if verbose:
+            print("[COOKIE] Locator handler clicking consent button")
+        locator.first.click()
+
+    page.add_locator_handler(
+        page.locator(", ".join(HANDLER_COOKIE_SELECTORS)), handler, times=times
+    )
+
+    if verbose:
+        print("[COOKIE] Installed cookie consent locator handler")
+
+
 def dismiss_cookie_consent_js(page: Page, verbose: bool = False) -> bool:
     """
     Alternative: Dismiss cookie consent using JavaScript injection.
@@ -137,28 +528,7 @@ def dismiss_cookie_consent_js(page: Page, verbose: bool = False) -> bool:
 
     This approach clicks buttons containing accept-related text.
     """
-    result = page.evaluate('''() => {
-        const acceptTexts = [
-            'accept all', 'accept cookies', 'allow all', 'allow cookies',
-            'i agree', 'agree', 'got it', 'ok', 'continue',
-            'accetta', 'accetto', 'consenti',
-            'akzeptieren', 'zustimmen',
-            'accepter', "j'accepte",
-            'aceptar'
-        ];
-
-        const buttons = document.querySelectorAll('button, [role="button"], a.button');
-        for (const btn of buttons) {
-            const text = btn.textContent?.toLowerCase().trim() || '';
-            for (const acceptText of acceptTexts) {
-                if (text.includes(acceptText)) {
-                    btn.click();
-                    return { found: true, text: btn.textContent };
-                }
-            }
-        }
-        return { found: false };
-    }''')
+    result = _call_cookie_js(page, "dismiss")
 
     if verbose:
         if result.get('found'):
@@ -169,74 +539,32 @@ def dismiss_cookie_consent_js(page: Page, verbose: bool = False) -> bool:
     return result.get('found', False)
 
 
-def dismiss_all_overlays(page: Page, verbose: bool = False) -> None:
+def dismiss_all_overlays(page: Page, verbose: bool = False) -> bool:
     """
     Dismiss cookie consent AND other blocking overlays (modals, popups, dialogs).
 
     Call this after page load to ensure no overlays block interaction.
+    Cookie consent, close buttons, and overlay removal run in a single
+    in-page call that returns once the DOM stops mutating.
 
     Args:
         page: Playwright Page object
         verbose: Print debug info
 
+    Returns:
+        True if anything was clicked or removed, False otherwise
+
     Usage:
         page.goto('https://example.com')
         page.wait_for_load_state('networkidle')
         dismiss_all_overlays(page)  # Clears cookies AND other overlays
     """
-    # First: cookie consent
-    dismiss_cookie_consent(page, verbose=verbose)
-
-    # Second: dismiss other common overlays via JavaScript
-    page.evaluate('''() => {
-        // Close any modal/dialog overlays by clicking close buttons
-        const closeSelectors = [
-            '[aria-label="Close"]',
-            '[aria-label="close"]',
-            'button[class*="close"]',
-            'button[class*="dismiss"]',
-            '.modal-close',
-            '.popup-close',
-            '.overlay-close',
-            '[data-dismiss="modal"]',
-            '.btn-close',
-            'button svg[class*="close"]',
-            '[data-testid="close-button"]',
-            '[data-testid="modal-close"]',
-        ];
-
-        for (const sel of closeSelectors) {
-            const btn = document.querySelector(sel);
-            if (btn && btn.offsetParent !== null) {
-                btn.click();
-                break;
-            }
-        }
-
-        // Remove overlay elements that block interaction
-        const overlaySelectors = [
-            '.modal-backdrop',
-            '.overlay',
-            '[class*="overlay"]',
-            '[class*="modal-overlay"]',
-            '[class*="popup-overlay"]',
-            '[class*="backdrop"]',
-        ];
-
-        for (const sel of overlaySelectors) {
-            const overlays = document.querySelectorAll(sel);
-            overlays.forEach(el => {
-                const style = window.getComputedStyle(el);
-                if (style.position === 'fixed' || style.position === 'absolute') {
-                    el.remove();
-                }
-            });
-        }
-    }''')
-    page.wait_for_timeout(300)
+    result = _call_cookie_js(page, "dismissAll")
 
     if verbose:
-        print("[OVERLAY] Dismissed all overlays")
+        _report_overlays(result)
+
+    return bool(result.get('cookie') or result.get('closed') or result.get('removed'))
 
 
 def force_remove_overlay(page: Page, verbose: bool = False) -> int:
@@ -261,100 +589,10 @@ def force_remove_overlay(page: Page, verbose: bool = False) -> int:
         removed = force_remove_overlay(page)
         print(f"Removed {removed} blocking elements")
     """
-    result = page.evaluate('''() => {
-        let removed = 0;
-        const removedElements = [];
-
-        // 1. Remove elements by common overlay/modal class patterns
-        const classPatterns = [
-            'cookie', 'consent', 'gdpr', 'privacy', 'notice', 'banner',
-            'modal', 'overlay', 'popup', 'dialog', 'backdrop', 'mask',
-            'notification', 'alert-overlay', 'blocker'
-        ];
-
-        for (const pattern of classPatterns) {
-            // Match class names containing the pattern
-            const elements = document.querySelectorAll(`[class*="${pattern}"]`);
-            for (const el of elements) {
-                const style = window.getComputedStyle(el);
-                // Only remove fixed/absolute positioned elements that cover significant area
-                if (style.position === 'fixed' || style.position === 'absolute') {
-                    const rect = el.getBoundingClientRect();
-                    // Check if element covers significant viewport area or is near top/bottom
-                    const coversViewport = rect.width > window.innerWidth * 0.3 ||
-                                          rect.height > window.innerHeight * 0.2;
-                    const isEdgeBanner = rect.top <= 100 || rect.bottom >= window.innerHeight - 100;
-
-                    if (coversViewport || isEdgeBanner) {
-                        removedElements.push({
-                            tag: el.tagName,
-                            class: el.className,
-                            id: el.id
-                        });
-                        el.remove();
-                        removed++;
-                    }
-                }
-            }
-        }
-
-        // 2. Remove elements by ID patterns
-        const idPatterns = [
-            'cookie', 'consent', 'gdpr', 'privacy', 'modal', 'overlay', 'popup'
-        ];
-
-        for (const pattern of idPatterns) {
-            const elements = document.querySelectorAll(`[id*="${pattern}"]`);
-            for (const el of elements) {
-                const style = window.getComputedStyle(el);
-                if (style.position === 'fixed' || style.position === 'absolute') {
-                    if (!removedElements.some(r => r.id === el.id)) {
-                        removedElements.push({
-                            tag: el.tagName,
-                            class: el.className,
-                            id: el.id
-                        });
-                        el.remove();
-                        removed++;
-                    }
-                }
-            }
-        }
-
-        // 3. Remove any remaining full-screen fixed elements with high z-index
-        const fixedElements = document.querySelectorAll('*');
-        for (const el of fixedElements) {
-            const style = window.getComputedStyle(el);
-            if (style.position === 'fixed') {
-                const zIndex = parseInt(style.zIndex) || 0;
-                const rect = el.getBoundingClientRect();
-                // High z-index AND covers most of viewport
-                if (zIndex > 100 &&
-                    rect.width > window.innerWidth * 0.5 &&
-                    rect.height > window.innerHeight * 0.5) {
-                    removedElements.push({
-                        tag: el.tagName,
-                        class: el.className,
-                        id: el.id,
-                        zIndex: zIndex
-                    });
-                    el.remove();
-                    removed++;
-                }
-            }
-        }
-
-        // 4. Reset body overflow (often set to 'hidden' when modals are open)
-        document.body.style.overflow = 'auto';
-        document.documentElement.style.overflow = 'auto';
-
-        return { removed, elements: removedElements };
-    }''')
+    result = _call_cookie_js(page, "force")
 
     if verbose:
-        print(f"[FORCE-REMOVE] Removed {result['removed']} blocking elements:")
-        for el in result.get('elements', []):
-            print(f"  - <{el['tag']}> class='{el.get('class', '')}' id='{el.get('id', '')}'")
+        _report_force_removed(result)
 
     return result['removed']
 
@@ -369,29 +607,68 @@ def set_cookie_consent_storage(page: Page, verbose: bool = False) -> None:
         set_cookie_consent_storage(page)
         page.reload()  # Reload with consent set
     """
-    page.evaluate('''() => {
-        // Common localStorage keys
-        const consentKeys = [
-            'cookie-consent', 'cookieConsent', 'cookies-accepted',
-            'gdpr-consent', 'gdprConsent', 'privacy-consent',
-            'CookieConsent', 'cookie_consent', 'cookies_accepted'
-        ];
-
-        for (const key of consentKeys) {
-            localStorage.setItem(key, 'accepted');
-            localStorage.setItem(key, 'true');
-            localStorage.setItem(key, '1');
-        }
-
-        // Set cookies too
-        document.cookie = 'cookie-consent=accepted; path=/; max-age=31536000';
-        document.cookie = 'gdpr-consent=accepted; path=/; max-age=31536000';
-    }''')
+    _call_cookie_js(page, "setStorage")
 
     if verbose:
         print("[COOKIE] Set consent in localStorage and cookies")
 
 
+async def dismiss_cookie_consent_async(
+    page: AsyncPage, timeout: int = 3000, verbose: bool = False
+) -> bool:
+    """
+    Async version of dismiss_cookie_consent() for playwright.async_api pages.
+
+    Returns:
+        True if a cookie banner was dismissed, False otherwise
+    """
+    for selector in COOKIE_SELECTORS:
+        try:
+            btn = page.locator(selector).first
+            if await btn.is_visible(timeout=timeout):
+                if verbose:
+                    print(f"[COOKIE] Found and clicking: {selector}")
+                await btn.click()
+                await asyncio.sleep(0.5)  # Brief pause for banner to close
+                return True
+        except Exception:
+            continue
+
+    if verbose:
+        print("[COOKIE] No cookie consent banner found")
+    return False
+
+
+async def dismiss_all_overlays_async(page: AsyncPage, verbose: bool = False) -> bool:
+    """
+    Async version of dismiss_all_overlays() for playwright.async_api pages.
+
+    Returns:
+        True if anything was clicked or removed, False otherwise
+    """
+    result = await _call_cookie_js_async(page, "dismissAll")
+
+    if verbose:
+        _report_overlays(result)
+
+    return bool(result.get('cookie') or result.get('closed') or result.get('removed'))
+
+
+async def force_remove_overlay_async(page: AsyncPage, verbose: bool = False) -> int:
+    """
+    Async version of force_remove_overlay() for playwright.async_api pages.
+
+    Returns:
+        Number of elements removed
+    """
+    result = await _call_cookie_js_async(page, "force")
+
+    if verbose:
+        _report_force_removed(result)
+
+    return result['removed']
+
+
 if __name__ == "__main__":
     # Demo/test
     from playwright.sync_api import sync_playwright
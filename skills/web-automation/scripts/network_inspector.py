@@ -1,6 +1,6 @@
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["playwright"]
+# dependencies = ["orjson", "playwright"]
 # ///
 # ABOUTME: Network request/response inspector using Chrome DevTools Protocol
 # ABOUTME: Captures XHR, fetch, WebSocket with timing, headers, and optional bodies
@@ -22,18 +22,163 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import re
 import sys
+import time
+from collections import Counter, OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, AsyncIterator, BinaryIO, Callable
 
+import orjson
 from playwright.async_api import async_playwright
 
+try:
+    import re2  # google-re2: linear-time matching, immune to catastrophic backtracking
+except ImportError:
+    re2 = None
+
+# How often buffered CDP events are applied, in seconds
+FLUSH_INTERVAL = 0.05
+# Maximum Network.getResponseBody calls the body worker keeps in flight
+BODY_BATCH_SIZE = 32
+# Bodies whose transfer size exceeds max_body_size times this (allowing for
+# compression) are not fetched at all, since they would only be truncated
+BODY_SKIP_FACTOR = 4
+# With stop_when_idle, capture ends once nothing has been in flight for
+# IDLE_QUIET_PERIOD seconds, checked every IDLE_POLL_INTERVAL
+IDLE_POLL_INTERVAL = 0.25
+IDLE_QUIET_PERIOD = 1.5
+# Header values shorter than this are shared across requests; longer ones
+# (cookies, CSP, tokens) are rarely repeated and stay as-is
+HEADER_INTERN_MAX_LEN = 64
+
+
+# Any of these makes a URL filter a real regex rather than a literal substring
+_REGEX_METACHARS = re.compile(r"[.^$*+?()\[\]{}|\\]")
+
+
+@asynccontextmanager
+async def _chromium() -> AsyncIterator[Any]:
+    """Launch a headless Chromium and close it on exit."""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            yield browser
+        finally:
+            await browser.close()
+
+
+def _compile_url_pattern(pattern: str) -> Any:
+    """Compile a URL filter with RE2 when available, falling back to stdlib re."""
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass  # RE2 rejects backreferences and lookaround
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=32)
+def _lower(resource_type: str) -> str:
+    """Lowercase a CDP resource type; there are only ~14 distinct values."""
+    return resource_type.lower()
+
+
+def _intern_headers(headers: dict[str, str], table: dict[str, str]) -> dict[str, str]:
+    """Copy a header dict, reusing one string instance per repeated name and short value."""
+    intern = table.setdefault
+    return {
+        intern(k, k): intern(v, v) if len(v) < HEADER_INTERN_MAX_LEN else v
+        for k, v in headers.items()
+    }
+
+
+def _base64_decoded_size(data: str) -> int:
+    """Byte length of a base64 payload, computed without decoding it."""
+    return len(data) * 3 // 4 - data[-2:].count("=")
+
+
+@dataclass(slots=True)
+class PendingRequest:
+    """In-flight request state; converted to the output dict once it completes."""
+
+    id: str
+    url: str
+    method: str
+    type: str
+    req_headers: dict[str, str]
+    post_data: str | None
+    timestamp: float
+    timing: dict[str, float] = field(default_factory=dict)
+    response_status: int | None = None
+    response_status_text: str = ""
+    response_headers: dict[str, str] = field(default_factory=dict)
+    mime_type: str = ""
+    remote_address: str | None = None
+    error: dict[str, Any] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Build the output record for this request."""
+        response = None
+        if self.response_status is not None:
+            response = {
+                "status": self.response_status,
+                "status_text": self.response_status_text,
+                "headers": self.response_headers,
+                "mime_type": self.mime_type,
+                "remote_address": self.remote_address,
+            }
+        return {
+            "id": self.id,
+            "url": self.url,
+            "method": self.method,
+            "type": self.type,
+            "request": {
+                "headers": self.req_headers,
+                "post_data": self.post_data,
+            },
+            "timestamp": self.timestamp,
+            "timing": self.timing,
+            "response": response,
+            "error": self.error,
+        }
+
 
 class NetworkInspector:
     """Captures network requests via CDP Network domain."""
 
+    __slots__ = (
+        "filter_types",
+        "_filter_set",
+        "url_pattern_source",
+        "_url_literal",
+        "url_pattern",
+        "_filtering",
+        "errors_only",
+        "capture_bodies",
+        "max_body_size",
+        "max_in_flight",
+        "stop_when_idle",
+        "writer",
+        "requests",
+        "orphaned",
+        "failed_events",
+        "completed",
+        "client",
+        "_total",
+        "_errors",
+        "_by_type",
+        "_by_status",
+        "_wall_base",
+        "_mono_base",
+        "_events",
+        "_body_queue",
+        "_header_intern",
+    )
+
     def __init__(
         self,
         filter_types: list[str] | None = None,
@@ -41,23 +186,68 @@ class NetworkInspector:
         errors_only: bool = False,
         capture_bodies: bool = False,
         max_body_size: int = 10240,
+        max_in_flight: int = 4096,
+        stop_when_idle: bool = False,
+        writer: BinaryIO | None = None,
     ):
         self.filter_types = filter_types
-        self.url_pattern = re.compile(url_pattern) if url_pattern else None
+        self._filter_set = frozenset(t.lower() for t in filter_types) if filter_types else None
+        self.url_pattern_source = url_pattern
+        # Plain substrings (the common "api/" case) skip the regex engine entirely
+        self._url_literal: str | None = None
+        self.url_pattern = None
+        if url_pattern:
+            if _REGEX_METACHARS.search(url_pattern):
+                self.url_pattern = _compile_url_pattern(url_pattern)
+            else:
+                self._url_literal = url_pattern
+        # Without any filter every request is captured, so skip the check entirely
+        self._filtering = bool(self._filter_set or self._url_literal or self.url_pattern)
         self.errors_only = errors_only
         self.capture_bodies = capture_bodies
         self.max_body_size = max_body_size
-
-        self.requests: dict[str, dict[str, Any]] = {}
+        self.max_in_flight = max_in_flight
+        self.stop_when_idle = stop_when_idle
+        # When set, finished requests are streamed here as NDJSON lines instead
+        # of being kept in self.completed
+        self.writer = writer
+
+        # In-flight requests, oldest first; capped at max_in_flight so long-lived
+        # connections (WebSockets, long-poll) cannot grow it without bound
+        self.requests: OrderedDict[str, PendingRequest] = OrderedDict()
+        self.orphaned = 0
+        # Buffered CDP events whose handler raised; skipped so the capture goes on
+        self.failed_events = 0
         self.completed: list[dict[str, Any]] = []
         self.client = None
 
+        # Summary counters, updated as each request is recorded
+        self._total = 0
+        self._errors = 0
+        self._by_type: Counter[str] = Counter()
+        self._by_status = {"2xx": 0, "3xx": 0, "4xx": 0, "5xx": 0, "failed": 0}
+
+        # Wall clock anchor for events without wallTime; reset when capture starts
+        self._wall_base = time.time()
+        self._mono_base = time.monotonic()
+
+        # CDP events are buffered in arrival order and applied every FLUSH_INTERVAL
+        self._events: deque[tuple[Callable[[dict], None], dict]] = deque()
+        # Finished requests awaiting a body fetch; None tells the worker to stop
+        self._body_queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        # One shared instance per distinct header name and short value; lives
+        # only as long as this inspector so nothing accumulates across captures
+        self._header_intern: dict[str, str] = {}
+
     def _should_capture(self, url: str, resource_type: str) -> bool:
         """Check if request matches filters."""
-        if self.filter_types:
-            if resource_type.lower() not in [t.lower() for t in self.filter_types]:
+        if self._filter_set:
+            if _lower(resource_type) not in self._filter_set:
                 return False
 
+        if self._url_literal is not None:
+            return self._url_literal in url
+
         if self.url_pattern:
             if not self.url_pattern.search(url):
                 return False
@@ -70,95 +260,209 @@ class NetworkInspector:
         request = params["request"]
         resource_type = params.get("type", "Other")
 
-        if not self._should_capture(request["url"], resource_type):
+        if self._filtering and not self._should_capture(request["url"], resource_type):
             return
 
-        self.requests[request_id] = {
-            "id": request_id,
-            "url": request["url"],
-            "method": request["method"],
-            "type": resource_type,
-            "request": {
-                "headers": request.get("headers", {}),
-                "post_data": request.get("postData"),
-            },
-            "timestamp": params.get("wallTime", datetime.now(timezone.utc).timestamp()),
-            "timing": {},
-            "response": None,
-            "error": None,
-        }
+        requests = self.requests
+        requests[request_id] = PendingRequest(
+            id=request_id,
+            url=request["url"],
+            method=request["method"],
+            type=resource_type,
+            req_headers=_intern_headers(request.get("headers", {}), self._header_intern),
+            post_data=request.get("postData"),
+            timestamp=params.get("wallTime")
+            or self._wall_base + (time.monotonic() - self._mono_base),
+        )
+        requests.move_to_end(request_id)
+        if len(requests) > self.max_in_flight:
+            requests.popitem(last=False)
+            self.orphaned += 1
 
     def _on_response_received(self, params: dict) -> None:
         """Handle Network.responseReceived event."""
-        request_id = params["requestId"]
-        if request_id not in self.requests:
+        pending = self.requests.get(params["requestId"])
+        if pending is None:
             return
 
         response = params["response"]
-        self.requests[request_id]["response"] = {
-            "status": response["status"],
-            "status_text": response.get("statusText", ""),
-            "headers": response.get("headers", {}),
-            "mime_type": response.get("mimeType", ""),
-            "remote_address": response.get("remoteIPAddress"),
-        }
+        pending.response_status = response["status"]
+        pending.response_status_text = response.get("statusText", "")
+        pending.response_headers = _intern_headers(response.get("headers", {}), self._header_intern)
+        pending.mime_type = response.get("mimeType", "")
+        pending.remote_address = response.get("remoteIPAddress")
 
         timing = response.get("timing")
         if timing:
-            self.requests[request_id]["timing"] = {
+            pending.timing = {
                 "dns_ms": timing.get("dnsEnd", 0) - timing.get("dnsStart", 0),
                 "connect_ms": timing.get("connectEnd", 0) - timing.get("connectStart", 0),
                 "ssl_ms": timing.get("sslEnd", 0) - timing.get("sslStart", 0),
                 "ttfb_ms": timing.get("receiveHeadersEnd", 0),
             }
 
-    async def _on_loading_finished(self, params: dict) -> None:
+    def _on_loading_finished(self, params: dict) -> None:
         """Handle Network.loadingFinished event."""
-        request_id = params["requestId"]
-        if request_id not in self.requests:
+        pending = self.requests.pop(params["requestId"], None)
+        if pending is None:
+            return
+
+        if self.errors_only and not pending.error and (pending.response_status or 0) < 400:
             return
 
-        req = self.requests[request_id]
+        req = pending.to_dict()
         req["completed"] = True
         req["encoded_data_length"] = params.get("encodedDataLength", 0)
 
+        body_pending = False
         if self.capture_bodies and self.client:
-            try:
-                body_response = await self.client.send(
-                    "Network.getResponseBody",
-                    {"requestId": request_id},
-                )
-                body = body_response.get("body", "")
-                if len(body) > self.max_body_size:
-                    body = body[: self.max_body_size] + f"... (truncated, total {len(body)} bytes)"
-                req["response_body"] = body
-                req["body_base64"] = body_response.get("base64Encoded", False)
-            except Exception:
-                req["response_body"] = None
-
-        if not self.errors_only or req.get("error") or (req.get("response", {}).get("status", 0) >= 400):
-            self.completed.append(req)
+            if req["encoded_data_length"] > self.max_body_size * BODY_SKIP_FACTOR:
+                req["response_body"] = "<skipped: exceeds max_body_size>"
+            else:
+                self._body_queue.put_nowait(req)
+                body_pending = True
 
-        del self.requests[request_id]
+        self._record(req, body_pending)
 
     def _on_loading_failed(self, params: dict) -> None:
         """Handle Network.loadingFailed event."""
-        request_id = params["requestId"]
-        if request_id not in self.requests:
+        pending = self.requests.pop(params["requestId"], None)
+        if pending is None:
             return
 
-        req = self.requests[request_id]
-        req["error"] = {
+        pending.error = {
             "type": params.get("type", "Unknown"),
             "error_text": params.get("errorText", ""),
             "canceled": params.get("canceled", False),
             "blocked_reason": params.get("blockedReason"),
             "cors_error": params.get("corsErrorStatus"),
         }
+        req = pending.to_dict()
         req["completed"] = False
 
-        self.completed.append(req)
-        del self.requests[request_id]
+        self._record(req)
+
+    def _record(self, req: dict[str, Any], body_pending: bool = False) -> None:
+        """Count a finished request and keep it, or stream it once its body is in."""
+        self._tally(req)
+        if self.writer is None:
+            self.completed.append(req)
+        elif not body_pending:
+            self._write(req)
+
+    def _write(self, req: dict[str, Any]) -> None:
+        """Write one request as an NDJSON line."""
+        self.writer.write(orjson.dumps(req, default=str, option=orjson.OPT_APPEND_NEWLINE))
+
+    def _tally(self, req: dict[str, Any]) -> None:
+        """Add a recorded request to the summary counters."""
+        self._total += 1
+        self._by_type[req.get("type", "Other")] += 1
+        by_status = self._by_status
+        response = req.get("response")
+        if req.get("error"):
+            by_status["failed"] += 1
+            self._errors += 1
+        elif response:
+            status = response.get("status", 0)
+            if status >= 500:
+                by_status["5xx"] += 1
+            elif status >= 400:
+                by_status["4xx"] += 1
+            elif status >= 300:
+                by_status["3xx"] += 1
+            elif status >= 200:
+                by_status["2xx"] += 1
+            if status >= 400:
+                self._errors += 1
+
+    async def _fetch_body(self, req: dict[str, Any]) -> None:
+        """Fetch and store the (possibly truncated) response body for a finished request."""
+        try:
+            body_response = await self.client.send(
+                "Network.getResponseBody",
+                {"requestId": req["id"]},
+            )
+            body = body_response.get("body", "")
+            is_base64 = body_response.get("base64Encoded", False)
+            if is_base64:
+                # Binary payload: record its size only, a base64 prefix is not useful
+                req["response_body"] = None
+                req["body_size"] = _base64_decoded_size(body)
+            else:
+                if len(body) > self.max_body_size:
+                    body = body[: self.max_body_size] + f"... (truncated, total {len(body)} bytes)"
+                req["response_body"] = body
+            req["body_base64"] = is_base64
+        except Exception:
+            req["response_body"] = None
+        if self.writer is not None:
+            self._write(req)
+
+    def _buffered(self, handler: Callable[[dict], None]) -> Callable[[dict], None]:
+        """Wrap a handler so the CDP callback only appends to the event buffer."""
+        append = self._events.append
+        return lambda params: append((handler, params))
+
+    def _flush(self) -> None:
+        """Apply buffered events in arrival order."""
+        events = self._events
+        popleft = events.popleft
+        while events:
+            handler, params = popleft()
+            try:
+                handler(params)
+            except Exception:
+                self.failed_events += 1
+
+    async def _flush_loop(self, stop: asyncio.Event) -> None:
+        """Flush every FLUSH_INTERVAL until stopped, with one final flush."""
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), FLUSH_INTERVAL)
+            except TimeoutError:
+                pass
+            self._flush()
+
+    async def _body_worker(self) -> None:
+        """Fetch queued bodies up to BODY_BATCH_SIZE at a time until the None sentinel."""
+        queue = self._body_queue
+        while True:
+            req = await queue.get()
+            if req is None:
+                return
+
+            batch = [req]
+            done = False
+            while len(batch) < BODY_BATCH_SIZE:
+                try:
+                    req = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if req is None:
+                    done = True
+                    break
+                batch.append(req)
+
+            await asyncio.gather(*(self._fetch_body(r) for r in batch))
+            if done:
+                return
+
+    async def _wait_until_idle(self, duration: float) -> None:
+        """Sleep until the network has been quiet for IDLE_QUIET_PERIOD, at most duration."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + duration
+        idle_since: float | None = None
+        while loop.time() < deadline:
+            await asyncio.sleep(min(IDLE_POLL_INTERVAL, max(deadline - loop.time(), 0)))
+            if self.requests or self._events:
+                idle_since = None
+                continue
+            now = loop.time()
+            if idle_since is None:
+                idle_since = now
+            elif now - idle_since >= IDLE_QUIET_PERIOD:
+                return
 
     async def capture(
         self,
@@ -169,6 +473,12 @@ class NetworkInspector:
         """
         Capture network requests for a URL.
 
+        By default the full duration is captured after the page loads. With
+        stop_when_idle, capture ends early once no captured request has been
+        in flight for IDLE_QUIET_PERIOD seconds; requests excluded by the type
+        or URL filters do not count, and later timer or polling requests are
+        missed.
+
         Args:
             url: URL to navigate to
             duration: Maximum capture duration in seconds
@@ -177,22 +487,36 @@ class NetworkInspector:
         Returns:
             Capture results dictionary
         """
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
+        async with _chromium() as browser:
+            return await self._capture_on_new_context(browser, url, duration, wait_for_idle)
+
+    async def _capture_on_new_context(
+        self,
+        browser: Any,
+        url: str,
+        duration: float,
+        wait_for_idle: bool,
+    ) -> dict:
+        """Capture a URL in a fresh context of an already running browser."""
+        context = await browser.new_context()
+        try:
             page = await context.new_page()
 
             self.client = await context.new_cdp_session(page)
+            self._wall_base = time.time()
+            self._mono_base = time.monotonic()
 
             await self.client.send("Network.enable")
 
-            self.client.on("Network.requestWillBeSent", self._on_request_will_be_sent)
-            self.client.on("Network.responseReceived", self._on_response_received)
-            self.client.on(
-                "Network.loadingFinished",
-                lambda p: asyncio.create_task(self._on_loading_finished(p)),
-            )
-            self.client.on("Network.loadingFailed", self._on_loading_failed)
+            self.client.on("Network.requestWillBeSent", self._buffered(self._on_request_will_be_sent))
+            self.client.on("Network.responseReceived", self._buffered(self._on_response_received))
+            self.client.on("Network.loadingFinished", self._buffered(self._on_loading_finished))
+            self.client.on("Network.loadingFailed", self._buffered(self._on_loading_failed))
+
+            stop_flushing = asyncio.Event()
+            flush_task = asyncio.create_task(self._flush_loop(stop_flushing))
+            body_task = asyncio.create_task(self._body_worker())
+            started = asyncio.get_running_loop().time()
 
             try:
                 await page.goto(url, wait_until="domcontentloaded", timeout=30000)
@@ -203,10 +527,13 @@ class NetworkInspector:
                     except Exception:
                         pass
 
-                await asyncio.sleep(duration)
+                if self.stop_when_idle:
+                    await self._wait_until_idle(duration)
+                else:
+                    await asyncio.sleep(duration)
 
             except Exception as e:
-                self.completed.append(
+                self._record(
                     {
                         "id": "navigation_error",
                         "url": url,
@@ -215,56 +542,80 @@ class NetworkInspector:
                 )
 
             finally:
-                await browser.close()
-
-        error_count = sum(1 for r in self.completed if r.get("error") or (r.get("response", {}).get("status", 0) >= 400))
-
+                elapsed = asyncio.get_running_loop().time() - started
+                stop_flushing.set()
+                await flush_task
+                self._body_queue.put_nowait(None)
+                await body_task
+        finally:
+            await context.close()
+
+        summary = self._summarize()
         return {
             "metadata": {
                 "url": url,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "duration_seconds": duration,
+                "elapsed_seconds": round(elapsed, 3),
+                "stop_when_idle": self.stop_when_idle,
                 "browser": "Chromium",
                 "filters": {
                     "types": self.filter_types,
-                    "url_pattern": self.url_pattern.pattern if self.url_pattern else None,
+                    "url_pattern": self.url_pattern_source,
                     "errors_only": self.errors_only,
                 },
             },
             "data": self.completed,
-            "summary": {
-                "total": len(self.completed),
-                "errors": error_count,
-                "by_type": self._count_by_type(),
-                "by_status": self._count_by_status(),
-            },
+            "summary": summary,
+        }
+
+    def _summarize(self) -> dict[str, Any]:
+        """Build the summary from the running counters."""
+        return {
+            "total": self._total,
+            "errors": self._errors,
+            "orphaned": self.orphaned,
+            "failed_events": self.failed_events,
+            "by_type": dict(self._by_type),
+            "by_status": dict(self._by_status),
         }
 
-    def _count_by_type(self) -> dict[str, int]:
-        """Count requests by resource type."""
-        counts: dict[str, int] = {}
-        for req in self.completed:
-            req_type = req.get("type", "Other")
-            counts[req_type] = counts.get(req_type, 0) + 1
-        return counts
-
-    def _count_by_status(self) -> dict[str, int]:
-        """Count requests by status code range."""
-        counts = {"2xx": 0, "3xx": 0, "4xx": 0, "5xx": 0, "failed": 0}
-        for req in self.completed:
-            if req.get("error"):
-                counts["failed"] += 1
-            elif req.get("response"):
-                status = req["response"].get("status", 0)
-                if 200 <= status < 300:
-                    counts["2xx"] += 1
-                elif 300 <= status < 400:
-                    counts["3xx"] += 1
-                elif 400 <= status < 500:
-                    counts["4xx"] += 1
-                elif status >= 500:
-                    counts["5xx"] += 1
-        return counts
+
+async def capture_many(
+    urls: list[str],
+    concurrency: int = 4,
+    duration: float = 30.0,
+    wait_for_idle: bool = True,
+    **options: Any,
+) -> list[dict]:
+    """
+    Capture several URLs with one browser, each in its own context.
+
+    Args:
+        urls: URLs to capture
+        concurrency: Maximum captures running at once
+        duration: Maximum capture duration per URL in seconds
+        wait_for_idle: Wait for network idle before starting each timer
+        **options: NetworkInspector keyword arguments applied to every URL
+
+    Returns:
+        Capture results dictionaries, in the order of urls
+
+    Raises:
+        ValueError: If concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with _chromium() as browser:
+
+        async def capture_one(url: str) -> dict:
+            async with semaphore:
+                inspector = NetworkInspector(**options)
+                return await inspector._capture_on_new_context(browser, url, duration, wait_for_idle)
+
+        return await asyncio.gather(*(capture_one(url) for url in urls))
 
 
 async def main() -> None:
@@ -278,12 +629,24 @@ Examples:
     uv run network_inspector.py http://localhost:3000 --filter xhr,fetch
     uv run network_inspector.py http://localhost:3000 --url-pattern "api/" --capture-bodies
     uv run network_inspector.py http://localhost:3000 --output /tmp/network.json
+    uv run network_inspector.py --urls-file urls.txt --concurrency 8
+    uv run network_inspector.py http://localhost:3000 --ndjson | jq 'select(.response.status >= 400)'
 
 Resource types: Document, Stylesheet, Image, Media, Font, Script, TextTrack,
                 XHR, Fetch, Prefetch, EventSource, WebSocket, Manifest, Other
         """,
     )
-    parser.add_argument("url", help="URL to inspect")
+    parser.add_argument("url", nargs="?", help="URL to inspect")
+    parser.add_argument(
+        "--urls-file",
+        help="File with one URL per line; all are captured with a single browser",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum URLs captured at once with --urls-file (default: 4)",
+    )
     parser.add_argument(
         "--duration",
         "-d",
@@ -319,6 +682,22 @@ Resource types: Document, Stylesheet, Image, Media, Font, Script, TextTrack,
         default=10240,
         help="Maximum response body size to capture in bytes (default: 10240)",
     )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=4096,
+        help="Maximum pending requests tracked at once; oldest are dropped (default: 4096)",
+    )
+    parser.add_argument(
+        "--stop-when-idle",
+        action="store_true",
+        help=f"Stop before --duration once no captured request has been in flight for {IDLE_QUIET_PERIOD:g}s",
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream one JSON line per request as it finishes, then a metadata/summary line",
+    )
     parser.add_argument(
         "--output",
         "-o",
@@ -326,28 +705,71 @@ Resource types: Document, Stylesheet, Image, Media, Font, Script, TextTrack,
     )
 
     args = parser.parse_args()
+    if not args.url and not args.urls_file:
+        parser.error("a URL or --urls-file is required")
+    if args.ndjson and args.urls_file:
+        parser.error("--ndjson cannot be combined with --urls-file")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
 
     filter_types = None
     if args.filter:
         filter_types = [t.strip() for t in args.filter.split(",")]
 
-    inspector = NetworkInspector(
-        filter_types=filter_types,
-        url_pattern=args.url_pattern,
-        errors_only=args.errors_only,
-        capture_bodies=args.capture_bodies,
-        max_body_size=args.max_body_size,
+    options: dict[str, Any] = {
+        "filter_types": filter_types,
+        "url_pattern": args.url_pattern,
+        "errors_only": args.errors_only,
+        "capture_bodies": args.capture_bodies,
+        "max_body_size": args.max_body_size,
+        "max_in_flight": args.max_in_flight,
+        "stop_when_idle": args.stop_when_idle,
+    }
+
+    if args.ndjson:
+        out = open(args.output, "wb") if args.output else sys.stdout.buffer
+        try:
+            inspector = NetworkInspector(writer=out, **options)
+            results = await inspector.capture(args.url, duration=args.duration)
+            del results["data"]
+            out.write(orjson.dumps(results, default=str, option=orjson.OPT_APPEND_NEWLINE))
+            out.flush()
+        finally:
+            if args.output:
+                out.close()
+        if args.output:
+            print(f"Output written to: {args.output}", file=sys.stderr)
+        return
+
+    results: dict | list[dict]
+    if args.urls_file:
+        with open(args.urls_file) as f:
+            urls = [line.strip() for line in f if line.strip()]
+        if args.url:
+            urls.insert(0, args.url)
+        results = await capture_many(
+            urls,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            **options,
+        )
+    else:
+        inspector = NetworkInspector(**options)
+        results = await inspector.capture(args.url, duration=args.duration)
+
+    # orjson encodes straight to bytes, so no intermediate str or re-encode
+    raw = orjson.dumps(
+        results,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
     )
-
-    results = await inspector.capture(args.url, duration=args.duration)
-
-    json_str = json.dumps(results, indent=2, default=str)
     if args.output:
-        with open(args.output, "w") as f:
-            f.write(json_str)
+        with open(args.output, "wb") as f:
+            f.write(raw)
         print(f"Output written to: {args.output}", file=sys.stderr)
     else:
-        print(json_str)
+        sys.stdout.buffer.write(raw)
+        sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
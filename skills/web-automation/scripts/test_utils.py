@@ -21,17 +21,29 @@ Examples:
     python test_utils.py . --run --filter "e2e"
 """
 
+import copy
 import json
+import re
+import shutil
 import subprocess
 import sys
 import time
+import tomllib
 import signal
 import os
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import socket
 
+try:
+    import ijson  # streaming parser: only the keys we need are materialized
+except ImportError:
+    ijson = None
+
 
 @dataclass
 class TestFramework:
@@ -41,6 +53,11 @@ class TestFramework:
     command: list[str]
     config_file: Optional[str] = None
     test_dir: Optional[str] = None
+    display_cmd: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Joined once for the banners and config listing
+        self.display_cmd = " ".join(self.command)
 
 
 @dataclass
@@ -56,26 +73,183 @@ class TestConfig:
     server_port: Optional[int] = None
 
 
+# Port probe results are reused for this many seconds
+PORT_CACHE_TTL = 0.1
+
+# port -> (monotonic time of probe, in use)
+_port_cache: dict[int, tuple[float, bool]] = {}
+
+
 def is_port_in_use(port: int) -> bool:
     """Check if a port is already in use."""
+    cached = _port_cache.get(port)
+    if cached is not None and time.monotonic() - cached[0] < PORT_CACHE_TTL:
+        return cached[1]
+    return _probe_port(port)
+
+
+def _probe_port(port: int) -> bool:
+    """Connect to a port, bypassing and refreshing the cache."""
+    now = time.monotonic()
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        return s.connect_ex(("localhost", port)) == 0
+        in_use = s.connect_ex(("localhost", port)) == 0
+    _port_cache[port] = (now, in_use)
+    return in_use
+
 
+@lru_cache(maxsize=32)
+def _which(name: str) -> str:
+    """Absolute path of an executable on PATH, or the name itself if not found."""
+    return shutil.which(name) or name
 
-def detect_js_test_frameworks(repo_path: Path, package_json: dict) -> list[TestFramework]:
+
+def _snapshot_dir(path: str | os.PathLike) -> dict[str, os.DirEntry]:
+    """Entries of a directory by name, read with one scandir pass."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def _is_dir(entries: dict[str, os.DirEntry], name: str) -> bool:
+    """Whether a snapshot entry is a directory (answered from readdir data)."""
+    entry = entries.get(name)
+    return entry is not None and entry.is_dir()
+
+
+def _is_file(entries: dict[str, os.DirEntry], name: str) -> bool:
+    """Whether a snapshot entry is a regular file (answered from readdir data)."""
+    entry = entries.get(name)
+    return entry is not None and entry.is_file()
+
+
+# Frameworks that count as end-to-end or unit test runners
+_E2E_FRAMEWORKS = frozenset({"playwright", "cypress", "npm-test-e2e"})
+_UNIT_FRAMEWORKS = frozenset({"jest", "vitest", "pytest", "unittest", "mocha", "npm-test-unit"})
+
+# Flag each runner uses to select tests by name
+_FILTER_FLAGS = {
+    "playwright": "--grep",
+    "jest": "--testNamePattern",
+    "vitest": "--testNamePattern",
+    "pytest": "-k",
+}
+
+# Python project files scanned for test and web framework names
+PYTHON_CONFIG_FILES = ("pyproject.toml", "requirements.txt", "setup.py")
+
+# Framework names looked for in Python project files, matched case-insensitively
+# as substrings (so "pytest-cov" and "djangorestframework" count too)
+_PY_TOKEN_RE = re.compile(rb"(?i)pytest|fastapi|flask|django|uvicorn")
+
+
+def _read_python_configs(
+    repo_path: Path, root_entries: dict[str, os.DirEntry]
+) -> dict[str, set[str]]:
+    """Framework names found in each Python project file, scanning the raw bytes once."""
+    # setup.py is only consulted to spot pytest, which these marker files already settle
+    has_pytest_marker = "pytest.ini" in root_entries or "conftest.py" in root_entries
+    tokens = {}
+    for name in PYTHON_CONFIG_FILES:
+        if name not in root_entries or (name == "setup.py" and has_pytest_marker):
+            continue
+        with open(os.path.join(repo_path, name), "rb") as f:
+            blob = f.read()
+        tokens[name] = _pyproject_tokens(blob) if name == "pyproject.toml" else _python_tokens(blob)
+    return tokens
+
+
+def _python_tokens(blob: bytes) -> set[str]:
+    """Lowercased framework names mentioned anywhere in a file's contents."""
+    return {m.lower().decode() for m in _PY_TOKEN_RE.findall(blob)}
+
+
+def _pyproject_tokens(blob: bytes) -> set[str]:
+    """
+    Framework names declared as dependencies in a pyproject.toml.
+
+    Only dependency tables are considered, so names in comments, URLs or
+    descriptions do not count; a [tool.pytest] table also means pytest.
+    Layouts not covered here can still declare pytest, so if no table names
+    it, the raw bytes are scanned for it. Falls back to scanning the whole
+    file if it cannot be parsed.
+    """
+    try:
+        data = tomllib.loads(blob.decode())
+        project = data.get("project", {})
+        tool = data.get("tool", {})
+        poetry = tool.get("poetry", {})
+
+        specs = list(project.get("dependencies", []))
+        for group in project.get("optional-dependencies", {}).values():
+            specs.extend(group)
+        for group in data.get("dependency-groups", {}).values():
+            specs.extend(spec for spec in group if isinstance(spec, str))
+        specs.extend(poetry.get("dependencies", {}))
+        specs.extend(poetry.get("dev-dependencies", {}))
+        for group in poetry.get("group", {}).values():
+            specs.extend(group.get("dependencies", {}))
+        for env in tool.get("hatch", {}).get("envs", {}).values():
+            specs.extend(env.get("dependencies", []))
+            specs.extend(env.get("extra-dependencies", []))
+        specs.extend(tool.get("uv", {}).get("dev-dependencies", []))
+        for group in tool.get("pdm", {}).get("dev-dependencies", {}).values():
+            specs.extend(group)
+
+        tokens = _python_tokens("\n".join(specs).encode())
+    except (UnicodeDecodeError, tomllib.TOMLDecodeError, AttributeError, TypeError):
+        return _python_tokens(blob)
+
+    if "pytest" in tool or "pytest" in _python_tokens(blob):
+        tokens.add("pytest")
+    return tokens
+
+
+# The only package.json keys test detection reads
+PACKAGE_JSON_KEYS = frozenset({"dependencies", "devDependencies", "scripts"})
+
+
+def _load_package_json(path: Path) -> dict:
+    """Load the dependency and script sections of a package.json."""
+    if ijson is None:
+        with open(path) as f:
+            package_json = json.load(f)
+        return {k: v for k, v in package_json.items() if k in PACKAGE_JSON_KEYS}
+
+    builders: dict[str, "ijson.ObjectBuilder"] = {}
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f):
+            key = prefix.partition(".")[0]
+            if key not in PACKAGE_JSON_KEYS:
+                continue
+            if key not in builders:
+                builders[key] = ijson.ObjectBuilder()
+            builders[key].event(event, value)
+    return {key: builder.value for key, builder in builders.items()}
+
+
+def detect_js_test_frameworks(
+    repo_path: Path,
+    package_json: dict,
+    root_entries: Optional[dict[str, os.DirEntry]] = None,
+) -> list[TestFramework]:
     """Detect JavaScript/TypeScript test frameworks."""
+    if root_entries is None:
+        root_entries = _snapshot_dir(repo_path)
     frameworks = []
-    deps = {
-        **package_json.get("dependencies", {}),
-        **package_json.get("devDependencies", {}),
-    }
+    # Only membership is tested, so look through both maps instead of merging them
+    deps = ChainMap(
+        package_json.get("dependencies") or {},
+        package_json.get("devDependencies") or {},
+    )
     scripts = package_json.get("scripts", {})
 
     # Playwright
     if "@playwright/test" in deps or "playwright" in deps:
         config_file = None
         for cfg in ["playwright.config.ts", "playwright.config.js"]:
-            if (repo_path / cfg).exists():
+            if cfg in root_entries:
                 config_file = cfg
                 break
 
@@ -85,14 +259,14 @@ def detect_js_test_frameworks(repo_path: Path, package_json: dict) -> list[TestF
             runner="npx",
             command=cmd,
             config_file=config_file,
-            test_dir="tests/e2e" if (repo_path / "tests/e2e").exists() else "tests",
+            test_dir="tests/e2e" if "tests" in root_entries and "e2e" in _snapshot_dir(os.path.join(repo_path, "tests")) else "tests",
         ))
 
     # Jest
-    if "jest" in deps or (repo_path / "jest.config.js").exists() or (repo_path / "jest.config.ts").exists():
+    if "jest" in deps or "jest.config.js" in root_entries or "jest.config.ts" in root_entries:
         config_file = None
         for cfg in ["jest.config.js", "jest.config.ts", "jest.config.mjs"]:
-            if (repo_path / cfg).exists():
+            if cfg in root_entries:
                 config_file = cfg
                 break
 
@@ -111,7 +285,7 @@ def detect_js_test_frameworks(repo_path: Path, package_json: dict) -> list[TestF
             name="vitest",
             runner="npx",
             command=cmd,
-            config_file="vitest.config.ts" if (repo_path / "vitest.config.ts").exists() else None,
+            config_file="vitest.config.ts" if "vitest.config.ts" in root_entries else None,
         ))
 
     # Mocha
@@ -130,7 +304,7 @@ def detect_js_test_frameworks(repo_path: Path, package_json: dict) -> list[TestF
             name="cypress",
             runner="npx",
             command=cmd,
-            config_file="cypress.config.js" if (repo_path / "cypress.config.js").exists() else None,
+            config_file="cypress.config.js" if "cypress.config.js" in root_entries else None,
         ))
 
     # Check npm scripts for test commands
@@ -160,38 +334,36 @@ def detect_js_test_frameworks(repo_path: Path, package_json: dict) -> list[TestF
     return frameworks
 
 
-def detect_python_test_frameworks(repo_path: Path) -> list[TestFramework]:
+def detect_python_test_frameworks(
+    repo_path: Path,
+    root_entries: Optional[dict[str, os.DirEntry]] = None,
+    py_tokens: Optional[dict[str, set[str]]] = None,
+) -> list[TestFramework]:
     """Detect Python test frameworks."""
+    if root_entries is None:
+        root_entries = _snapshot_dir(repo_path)
+    if py_tokens is None:
+        py_tokens = _read_python_configs(repo_path, root_entries)
     frameworks = []
 
     # Check for pytest
     has_pytest = False
-    pyproject = repo_path / "pyproject.toml"
-    requirements = repo_path / "requirements.txt"
-    setup_py = repo_path / "setup.py"
-
-    content = ""
-    if pyproject.exists():
-        content += pyproject.read_text()
-    if requirements.exists():
-        content += requirements.read_text()
-    if setup_py.exists():
-        content += setup_py.read_text()
-
-    if "pytest" in content.lower() or (repo_path / "pytest.ini").exists() or (repo_path / "conftest.py").exists():
+    if "pytest.ini" in root_entries or "conftest.py" in root_entries:
+        has_pytest = True
+    elif any("pytest" in tokens for tokens in py_tokens.values()):
         has_pytest = True
 
     # Check for test directories
-    test_dirs = []
-    for d in ["tests", "test", "tests/unit", "tests/e2e", "tests/integration"]:
-        if (repo_path / d).exists():
-            test_dirs.append(d)
+    test_dirs = [d for d in ["tests", "test"] if d in root_entries]
+    if "tests" in root_entries:
+        nested = _snapshot_dir(os.path.join(repo_path, "tests"))
+        test_dirs.extend(f"tests/{d}" for d in ["unit", "e2e", "integration"] if d in nested)
 
     if has_pytest or test_dirs:
         cmd = ["pytest", "-v"]
-        if (repo_path / "pytest.ini").exists():
+        if "pytest.ini" in root_entries:
             config_file = "pytest.ini"
-        elif (repo_path / "pyproject.toml").exists():
+        elif "pyproject.toml" in root_entries:
             config_file = "pyproject.toml"
         else:
             config_file = None
@@ -201,7 +373,7 @@ def detect_python_test_frameworks(repo_path: Path) -> list[TestFramework]:
             runner="pytest",
             command=cmd,
             config_file=config_file,
-            test_dir="tests" if (repo_path / "tests").exists() else None,
+            test_dir="tests" if "tests" in root_entries else None,
         ))
 
     # Check for unittest
@@ -217,27 +389,61 @@ def detect_python_test_frameworks(repo_path: Path) -> list[TestFramework]:
     return frameworks
 
 
+def _mtime_ns(path: str) -> int:
+    """Modification time of a path in nanoseconds, or 0 if it is missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
 def detect_test_config(repo_path: str) -> TestConfig:
-    """Detect all test frameworks and configuration for a project."""
-    path = Path(repo_path).resolve()
+    """
+    Detect all test frameworks and configuration for a project.
+
+    Results are cached per repo. The cache is keyed on the mtimes of the
+    root and tests/ directories, which change when entries are added or
+    removed, and of the files whose contents detection reads. Each call
+    returns its own copy, so callers may modify it freely.
+    """
+    resolved = str(Path(repo_path).resolve())
+    content_mtimes = tuple(
+        _mtime_ns(os.path.join(resolved, name))
+        for name in ("tests", "package.json", *PYTHON_CONFIG_FILES)
+    )
+    return copy.deepcopy(
+        _detect_test_config_cached(resolved, _mtime_ns(resolved), content_mtimes)
+    )
+
+
+@lru_cache(maxsize=64)
+def _detect_test_config_cached(
+    resolved_path: str,
+    root_mtime_ns: int,
+    content_mtimes: tuple[int, ...],
+) -> TestConfig:
+    """Uncached detection; the mtime arguments only serve as cache key."""
+    path = Path(resolved_path)
     frameworks = []
     project_type = "unknown"
     server_required = False
     server_command = None
     server_port = None
+    root_entries = _snapshot_dir(path)
 
-    # Node.js project
-    package_json_path = path / "package.json"
-    if package_json_path.exists():
-        with open(package_json_path) as f:
-            package_json = json.load(f)
+    # Parsed once; Node and Hugo detection both work from this
+    package_json = None
+    if _is_file(root_entries, "package.json"):
+        package_json = _load_package_json(path / "package.json")
 
+    # Node.js project
+    if package_json is not None:
         project_type = "nodejs"
-        frameworks.extend(detect_js_test_frameworks(path, package_json))
+        frameworks.extend(detect_js_test_frameworks(path, package_json, root_entries))
 
         # Check if server is needed for e2e tests
         scripts = package_json.get("scripts", {})
-        if any(f.name in ["playwright", "cypress", "npm-test-e2e"] for f in frameworks):
+        if any(f.name in _E2E_FRAMEWORKS for f in frameworks):
             server_required = True
             if "dev" in scripts:
                 server_command = ["npm", "run", "dev"]
@@ -248,8 +454,8 @@ def detect_test_config(repo_path: str) -> TestConfig:
 
     # Hugo project (check for hugo.toml or config.toml with content/)
     hugo_configs = ["hugo.toml", "hugo.yaml", "hugo.json", "config.toml", "config.yaml"]
-    has_hugo = any((path / cfg).exists() for cfg in hugo_configs) and (
-        (path / "content").exists() or (path / "layouts").exists()
+    has_hugo = any(cfg in root_entries for cfg in hugo_configs) and (
+        _is_dir(root_entries, "content") or _is_dir(root_entries, "layouts")
     )
 
     if has_hugo:
@@ -258,47 +464,37 @@ def detect_test_config(repo_path: str) -> TestConfig:
         server_command = ["hugo", "server", "-D"]
         server_port = 1313
 
-        # Hugo projects often have package.json for test tooling
-        # Only detect JS frameworks if not already detected above
-        if package_json_path.exists() and not frameworks:
-            with open(package_json_path) as f:
-                package_json = json.load(f)
-            frameworks.extend(detect_js_test_frameworks(path, package_json))
+        # Any package.json test tooling was already detected by the Node.js check above
 
     # Python project
     has_python = any([
-        (path / "pyproject.toml").exists(),
-        (path / "requirements.txt").exists(),
-        (path / "setup.py").exists(),
+        "pyproject.toml" in root_entries,
+        "requirements.txt" in root_entries,
+        "setup.py" in root_entries,
     ])
 
     if has_python and project_type == "unknown":
         project_type = "python"
-        frameworks.extend(detect_python_test_frameworks(path))
+        py_tokens = _read_python_configs(path, root_entries)
+        frameworks.extend(detect_python_test_frameworks(path, root_entries, py_tokens))
 
         # Check for web frameworks that need server
-        content = ""
-        if (path / "pyproject.toml").exists():
-            content += (path / "pyproject.toml").read_text()
-        if (path / "requirements.txt").exists():
-            content += (path / "requirements.txt").read_text()
-
-        content_lower = content.lower()
-        if any(fw in content_lower for fw in ["fastapi", "flask", "django", "uvicorn"]):
+        found = py_tokens.get("pyproject.toml", set()) | py_tokens.get("requirements.txt", set())
+        if found & {"fastapi", "flask", "django", "uvicorn"}:
             server_required = True
-            if "fastapi" in content_lower or "uvicorn" in content_lower:
+            if "fastapi" in found or "uvicorn" in found:
                 server_command = ["uvicorn", "main:app", "--reload"]
                 server_port = 8000
-            elif "flask" in content_lower:
+            elif "flask" in found:
                 server_command = ["flask", "run"]
                 server_port = 5000
-            elif "django" in content_lower:
+            elif "django" in found:
                 server_command = ["python", "manage.py", "runserver"]
                 server_port = 8000
 
     # Determine test types
-    has_e2e = any(f.name in ["playwright", "cypress", "npm-test-e2e"] for f in frameworks)
-    has_unit = any(f.name in ["jest", "vitest", "pytest", "unittest", "mocha", "npm-test-unit"] for f in frameworks)
+    has_e2e = any(f.name in _E2E_FRAMEWORKS for f in frameworks)
+    has_unit = any(f.name in _UNIT_FRAMEWORKS for f in frameworks)
 
     return TestConfig(
         project_type=project_type,
@@ -315,10 +511,14 @@ def detect_test_config(repo_path: str) -> TestConfig:
 def wait_for_server(port: int, timeout: int = 60) -> bool:
     """Wait for server to be ready on the given port."""
     start = time.time()
+    delay = 0.05
     while time.time() - start < timeout:
-        if is_port_in_use(port):
+        # Always probe: a cached "free" would hide a server that just came up
+        if _probe_port(port):
             return True
-        time.sleep(0.5)
+        time.sleep(delay)
+        # Poll quickly at first so a fast server is seen early, then back off
+        delay = min(delay * 1.5, 0.5)
     return False
 
 
@@ -328,8 +528,18 @@ def run_tests(
     test_filter: Optional[str] = None,
     with_server: bool = False,
     verbose: bool = True,
+    parallel: int = 1,
+    decode_output: bool = True,
 ) -> dict:
-    """Run tests with optional server startup."""
+    """
+    Run tests with optional server startup.
+
+    With parallel > 1 and verbose off, up to that many frameworks run at
+    once; results keep the order of config.frameworks either way.
+
+    Output captured with verbose off is stored as str, or as raw bytes
+    when decode_output is False.
+    """
     results = {
         "success": True,
         "frameworks_run": [],
@@ -352,12 +562,12 @@ def run_tests(
                     print(f"Starting server: {' '.join(config.server_command)}")
 
                 server_proc = subprocess.Popen(
-                    config.server_command,
+                    [_which(config.server_command[0]), *config.server_command[1:]],
                     cwd=config.working_dir,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
                     text=True,
-                    preexec_fn=os.setsid if os.name != 'nt' else None,
+                    start_new_session=os.name != 'nt',
                 )
 
                 if verbose:
@@ -383,52 +593,63 @@ def run_tests(
             results["errors"].append("No test frameworks detected")
             return results
 
-        # Run each framework
-        for framework in frameworks_to_run:
+        def run_framework(framework: TestFramework) -> tuple[Optional[dict], Optional[str]]:
             if verbose:
-                print(f"\n{'='*60}")
-                print(f"Running {framework.name} tests...")
-                print(f"Command: {' '.join(framework.command)}")
-                print('='*60)
+                rule = '=' * 60
+                sys.stdout.write(
+                    f"\n{rule}\nRunning {framework.name} tests...\n"
+                    f"Command: {framework.display_cmd}\n{rule}\n"
+                )
+                # The test runner writes to the same stdout; keep the banner ahead of it
+                sys.stdout.flush()
 
             cmd = framework.command.copy()
+            cmd[0] = _which(cmd[0])
 
             # Add test filter if provided
             if test_filter:
-                if framework.name == "playwright":
-                    cmd.extend(["--grep", test_filter])
-                elif framework.name == "jest":
-                    cmd.extend(["--testNamePattern", test_filter])
-                elif framework.name == "pytest":
-                    cmd.extend(["-k", test_filter])
-                elif framework.name == "vitest":
-                    cmd.extend(["--testNamePattern", test_filter])
+                flag = _FILTER_FLAGS.get(framework.name)
+                if flag:
+                    cmd.extend([flag, test_filter])
 
             try:
                 result = subprocess.run(
                     cmd,
                     cwd=config.working_dir,
                     capture_output=not verbose,
-                    text=True,
+                    text=decode_output,
                 )
+            except Exception as e:
+                return None, f"{framework.name}: {str(e)}"
 
-                framework_result = {
-                    "name": framework.name,
-                    "success": result.returncode == 0,
-                    "returncode": result.returncode,
-                }
+            framework_result = {
+                "name": framework.name,
+                "success": result.returncode == 0,
+                "returncode": result.returncode,
+            }
 
-                if not verbose:
-                    framework_result["stdout"] = result.stdout
-                    framework_result["stderr"] = result.stderr
+            if not verbose:
+                framework_result["stdout"] = result.stdout
+                framework_result["stderr"] = result.stderr
 
-                results["frameworks_run"].append(framework_result)
+            return framework_result, None
 
-                if result.returncode != 0:
-                    results["success"] = False
+        # Run each framework; concurrent runs need captured output so it does not interleave
+        if parallel > 1 and not verbose:
+            with ThreadPoolExecutor(max_workers=parallel) as pool:
+                outcomes = list(pool.map(run_framework, frameworks_to_run))
+        else:
+            outcomes = map(run_framework, frameworks_to_run)
 
-            except Exception as e:
-                results["errors"].append(f"{framework.name}: {str(e)}")
+        for framework_result, error in outcomes:
+            if error:
+                results["errors"].append(error)
+                results["success"] = False
+                continue
+
+            results["frameworks_run"].append(framework_result)
+
+            if framework_result["returncode"] != 0:
                 results["success"] = False
 
     finally:
@@ -438,10 +659,14 @@ def run_tests(
                 print("\nStopping server...")
             try:
                 if os.name != 'nt':
-                    os.killpg(os.getpgid(server_proc.pid), signal.SIGTERM)
+                    # Started with start_new_session, so the server's pid is its process group id
+                    os.killpg(server_proc.pid, signal.SIGTERM)
                 else:
                     server_proc.terminate()
                 server_proc.wait(timeout=5)
+            except ProcessLookupError:
+                # Already exited on its own; just reap it
+                server_proc.wait()
             except Exception:
                 server_proc.kill()
 
@@ -464,12 +689,12 @@ def print_test_config(config: TestConfig) -> None:
 
     print(f"\n  Detected frameworks ({len(config.frameworks)}):")
     for fw in config.frameworks:
-        print(f"    - {fw.name}")
-        print(f"      Command: {' '.join(fw.command)}")
+        block = f"    - {fw.name}\n      Command: {fw.display_cmd}\n"
         if fw.config_file:
-            print(f"      Config: {fw.config_file}")
+            block += f"      Config: {fw.config_file}\n"
         if fw.test_dir:
-            print(f"      Test dir: {fw.test_dir}")
+            block += f"      Test dir: {fw.test_dir}\n"
+        sys.stdout.write(block)
 
 
 def main() -> None:
@@ -519,6 +744,12 @@ Examples:
         action="store_true",
         help="Suppress output, only show summary",
     )
+    parser.add_argument(
+        "--parallel", "-j",
+        type=int,
+        default=1,
+        help="Run up to N frameworks at once (requires --quiet; default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -540,6 +771,9 @@ Examples:
             test_filter=args.filter,
             with_server=args.with_server,
             verbose=not args.quiet,
+            parallel=args.parallel,
+            # Only the summary is printed, so captured output is never decoded
+            decode_output=False,
         )
 
         print("\n" + "="*60)